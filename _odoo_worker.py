@@ -0,0 +1,78 @@
+"""Long-running helper that runs click-odoo-contrib commands for tasks.py
+
+tasks.py starts it once with the virtual environment's Python and sends one
+JSON request per line on stdin::
+
+    {"module": "click_odoo_contrib.dropdb", "args": ["-c", "odoo.conf", "db"]}
+
+Each command runs in this process, so Odoo and click-odoo-contrib are only
+imported once per invoke session. Every request gets one JSON reply line,
+{"code": 0} or the command's non-zero exit code, written to the pipe whose
+file descriptor (a handle on Windows) is the first argument. stdout and
+stderr stay on the terminal for the commands and the processes they spawn.
+"""
+
+import importlib
+import json
+import os
+import sys
+import traceback
+
+import click
+
+
+def _dispatch(request: dict) -> int:
+    module_name = request["module"]
+    if not module_name.startswith("click_odoo_contrib."):
+        raise ValueError(f"Unsupported module: {module_name}")
+    module = importlib.import_module(module_name)
+    try:
+        # Without standalone_mode, click returns ctx.exit(n) codes instead
+        rv = module.main.main(
+            args=request["args"],
+            prog_name=module_name.rsplit(".", 1)[-1],
+            standalone_mode=False,
+        )
+        return rv if isinstance(rv, int) else 0
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        print("Aborted!", file=sys.stderr)
+        return 1
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        # Same as the interpreter does for sys.exit("message")
+        print(e.code, file=sys.stderr)
+        return 1
+
+
+def _open_replies(channel: str):
+    if os.name == "nt":
+        import msvcrt
+
+        channel = msvcrt.open_osfhandle(int(channel), os.O_WRONLY)
+    return os.fdopen(int(channel), "w", encoding="utf-8")
+
+
+def main():
+    replies = _open_replies(sys.argv[1])
+    # Odoo is not installed in the venv; like "python -m", import it from the
+    # server checkout the worker is started in
+    sys.path.insert(0, os.getcwd())
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            code = _dispatch(json.loads(line))
+        except Exception:
+            traceback.print_exc()
+            code = 1
+        sys.stdout.flush()
+        replies.write(json.dumps({"code": code}) + "\n")
+        replies.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,34 @@
+import atexit
+import hashlib
 import json
 import logging
-import platform
+import os
+import re
+import shlex
 import shutil
+import subprocess
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
 from invoke import task
-from yaml import Loader, load
+from invoke.exceptions import UnexpectedExit
+from invoke.runners import Result
+from yaml import load
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeLoader as _YLoader
 
 # Logger configuration
 logger = logging.getLogger(__name__)
@@ -17,32 +39,213 @@ if not logger.handlers:
     logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
-# Cached configuration and paths
-_CONFIG: dict[str, Any] | None = None
-_PROJECT_ROOT = Path(__file__).parent.absolute()
+# Project paths
+_PROJECT_ROOT = Path(__file__).resolve().parent
 _VENV_DIR = _PROJECT_ROOT / ".venv"
+_IS_WINDOWS = os.name == "nt"
+_VENV_BIN = _VENV_DIR / ("Scripts" if _IS_WINDOWS else "bin")
+_VENV_PYTHON = _VENV_BIN / ("python.exe" if _IS_WINDOWS else "python")
+_CONFIG_PATH = _PROJECT_ROOT / "config.yaml"
+_ODOO_WORKER = _PROJECT_ROOT / "_odoo_worker.py"
+_REQ_TXT = _PROJECT_ROOT / "requirements.txt"
+_ODOO_CONF = _PROJECT_ROOT / "odoo.conf"
+_PYRIGHT_CONF = _PROJECT_ROOT / "pyrightconfig.json"
+_VSCODE_DIR = _PROJECT_ROOT / ".vscode"
+_VSCODE_SETTINGS = _VSCODE_DIR / "settings.json"
+
+# Odoo requirements, with pins that fail to build on Python 3.10 bumped
+_OCB_REQS_URL = "https://raw.githubusercontent.com/OCA/OCB/17.0/requirements.txt"
+_OCB_REQS_FIXES = (
+    (
+        r"(gevent==)21\.8\.0( ; sys_platform != 'win32' and python_version == '3\.10')",
+        r"\g<1>22.10.2\2",
+    ),
+    (
+        r"(greenlet==)1\.1\.2( ; sys_platform != 'win32' and python_version == '3\.10')",
+        r"\g<1>2.0.2\2",
+    ),
+)
 
+# VSCode settings that do not depend on the configured paths
+_VSCODE_SETTINGS_STATIC = {
+    "python.languageServer": "None",
+    "[python]": {
+        "editor.formatOnSave": True,
+        "editor.codeActionsOnSave": {
+            "source.fixAll": "explicit",
+            "source.organizeImports": "explicit",
+        },
+        "editor.defaultFormatter": "charliermarsh.ruff",
+    },
+    "python.linting.pylintEnabled": True,
+    "restructuredtext.confPath": "",
+    "search.followSymlinks": False,
+    "search.useIgnoreFiles": False,
+    "[json]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
+    "[jsonc]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
+    "[markdown]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
+    "[yaml]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
+    "[xml]": {"editor.formatOnSave": False},
+    "workbench.editor.customLabels.patterns": {
+        "**/security/**": "${filename} - Security",
+        "**/security/*.csv": "${filename}.${extname} - Security",
+        "**/models/**": "${filename} - Model",
+        "**/data/*.csv": "${filename}.${extname} - Data",
+        "**/data/**": "${filename} - Data",
+        "**/demo/**": "${filename} - Demo",
+        "**/controllers/**": "${filename} - Controller",
+        "**/wizard/**": "${filename} - Wizard",
+        "**/wizards/**": "${filename} - Wizard",
+        "**/reports/**": "${filename} - Report",
+        "**/report/**": "${filename} - Report",
+        "**/tests/**": "${filename} - Test",
+        "**/views/**": "${filename} - View",
+        "**/static/src/**/*.js": "${filename} - Component ",
+        "**/static/src/**/*.xml": "${filename} - Template",
+        "**/static/src/**/*.scss": "${filename} - Style",
+        "**/__manifest__.py": "${dirname} - Odoo Manifest",
+        "**/__init__.py": "${dirname} - Module",
+        "**/docs/**": "${dirname} - Docs",
+        "**/doc/**": "${dirname} - Docs",
+    },
+}
+
+# odoo.conf: body of the [options] section, and an addons_path line in it
+_CONF_OPTIONS_RE = re.compile(r"(?ms)^[ \t]*\[options\][^\n]*\n(.*?)(?=^[ \t]*\[|\Z)")
+_CONF_ADDONS_RE = re.compile(r"(?m)^[ \t]*addons_path\s*=.*\n")
+
+# Generated JSON files are pretty-printed unless VSC_ODOO_COMPACT_JSON=1
+_JSON_PRETTY = os.environ.get("VSC_ODOO_COMPACT_JSON") != "1"
+
+
+def _yaml_cache_path(path: Path) -> Path:
+    """Location of the JSON cache kept next to a YAML file"""
+    return path.with_name(f".{path.stem}.cache.json")
+
+
+def _read_yaml_cache(path: Path, key: list[int]) -> dict[str, Any] | None:
+    """Return the cached YAML data if it was built from the same file"""
+    try:
+        cached = json.loads(_yaml_cache_path(path).read_bytes())
+        if isinstance(cached, dict) and cached.get("key") == key:
+            data = cached["data"]
+            if isinstance(data, dict):
+                return data
+    except Exception:
+        pass
+    return None
 
-def _load_config() -> dict[str, Any] | None:
-    """Load and cache configuration from config.yaml"""
-    global _CONFIG
-    if _CONFIG is None:
-        try:
-            config_path = _PROJECT_ROOT / "config.yaml"
-            logger.info("📂 Loading configuration from %s", config_path)
-            with open(config_path) as f:
-                _CONFIG = load(f, Loader=Loader)
-            logger.debug("✅ Configuration loaded successfully")
-        except Exception as e:
-            logger.error("❌ Failed to load configuration: %s", e)
-            raise RuntimeError("Configuration load failed") from e
-    return _CONFIG
-
-
-def _get_config_value(*keys: str) -> Any:
-    """Get a configuration value without path conversion"""
+
+def _write_yaml_cache(path: Path, key: list[int], data: dict[str, Any]) -> None:
+    """Persist parsed YAML data for the next invoke process
+
+    The cache is written to a temporary file and moved into place, so a
+    concurrent reader never sees a half-written cache.
+    """
+    cache_path = _yaml_cache_path(path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps({"key": key, "data": data}))
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("⚠️ Could not write configuration cache: %s", e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _write_if_changed(path: Path, content: bytes) -> bool:
+    """Write content to path unless the file already holds it
+
+    Changed files are replaced atomically through a temporary file that
+    takes over their permissions. A symlink is followed, so its target is
+    the file that gets replaced.
+    """
+    target = Path(os.path.realpath(path))
+    try:
+        if target.read_bytes() == content:
+            return False
+    except OSError:
+        pass
+    existed = target.exists()
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        if existed:
+            # Start private, so a 0600 odoo.conf (it holds admin_passwd and
+            # db_password) is never readable by others in between
+            tmp_path.touch(mode=0o600)
+        tmp_path.write_bytes(content)
+        if existed:
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def _dump_json(obj: Any, path: Path) -> bool:
+    """Write obj as JSON to path, using orjson when it is installed
+
+    The stdlib fallback produces the same bytes as orjson, so switching
+    interpreters does not rewrite unchanged files.
+    """
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if _JSON_PRETTY:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(obj, option=option)
+    else:
+        if _JSON_PRETTY:
+            text = json.dumps(obj, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+        payload = (text + "\n").encode()
+    return _write_if_changed(path, payload)
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML file, memoized on its path, mtime and size
+
+    Parsing uses libyaml (CSafeLoader) when PyYAML was built with it, as the
+    binary wheels are; source builds need the libyaml headers for that.
+    A JSON copy is reused across processes; set VSC_ODOO_CONFIG_CACHE=0 to
+    always parse the YAML.
+    """
+    path = Path(path_str)
+    cache_key = [mtime_ns, size]
+    use_cache = os.environ.get("VSC_ODOO_CONFIG_CACHE") != "0"
+    if use_cache:
+        data = _read_yaml_cache(path, cache_key)
+        if data is not None:
+            logger.debug("✅ Configuration loaded from cache")
+            return data
+    logger.info("📂 Loading configuration from %s", path)
+    data = load(path.read_bytes(), Loader=_YLoader)
+    logger.debug("✅ Configuration loaded successfully")
+    if use_cache:
+        _write_yaml_cache(path, cache_key, data)
+    return data
+
+
+def _load_config() -> dict[str, Any]:
+    """Load configuration from config.yaml, re-parsing it only after edits"""
     try:
-        value = _load_config()
+        stat = _CONFIG_PATH.stat()
+        return _load_yaml_cached(
+            os.fspath(_CONFIG_PATH), stat.st_mtime_ns, stat.st_size
+        )
+    except Exception as e:
+        logger.error("❌ Failed to load configuration: %s", e)
+        raise RuntimeError("Configuration load failed") from e
+
+
+def _get_config_value(*keys: str, cfg: dict[str, Any] | None = None) -> Any:
+    """Get a configuration value without path conversion
+
+    Pass cfg to reuse a configuration the caller already loaded.
+    """
+    try:
+        value = _load_config() if cfg is None else cfg
         for key in keys:
             value = value[key]
         return value
@@ -51,40 +254,156 @@ def _get_config_value(*keys: str) -> Any:
         raise ValueError(f"Missing configuration key: {keys}") from e
 
 
-def _get_config_path(*keys: str) -> Path:
+@dataclass(slots=True, frozen=True)
+class OdooPaths:
+    """Resolved paths from config.yaml shared by the tasks"""
+
+    server: Path
+    enterprise: Path | None
+    db_conf: Path | None
+    dest_dir: Path | None
+
+
+@cache
+def _paths_for(mtime_ns: int, size: int) -> OdooPaths:
+    """Resolve the configured paths for one revision of config.yaml"""
+    enterprise = _get_config_value("odoo").get("enterprise")
+    database = _load_config().get("database") or {}
+    return OdooPaths(
+        server=Path(_get_config_value("odoo", "server")).resolve(),
+        enterprise=Path(enterprise).resolve() if enterprise else None,
+        db_conf=(
+            Path(database["odoo_conf"]).resolve()
+            if database.get("odoo_conf")
+            else None
+        ),
+        dest_dir=Path(database["dest_dir"]) if database.get("dest_dir") else None,
+    )
+
+
+def _paths() -> OdooPaths:
+    """Get the resolved paths, rebuilt only when config.yaml changes"""
+    stat = _CONFIG_PATH.stat()
+    return _paths_for(stat.st_mtime_ns, stat.st_size)
+
+
+def _get_config_path(*keys: str, cfg: dict[str, Any] | None = None) -> Path:
     """Get a path from configuration with validation"""
-    value = _get_config_value(*keys)
+    value = _get_config_value(*keys, cfg=cfg)
     path = _PROJECT_ROOT / str(value)
     if not path.exists():
         logger.warning("⚠️ Path does not exist: %s", path)
     return path
 
 
+def _scan_dirs(dirs: set[Path]) -> dict[Path, frozenset[str]]:
+    """Map each directory to the names of its entries (empty if unreadable)"""
+    entries = {}
+    for directory in dirs:
+        try:
+            with os.scandir(directory) as it:
+                entries[directory] = frozenset(entry.name for entry in it)
+        except OSError:
+            entries[directory] = frozenset()
+    return entries
+
+
+@cache
 def _get_venv_python() -> Path:
     """Get path to virtual environment Python interpreter"""
-    if platform.system() == "Windows":
-        python_exe = _VENV_DIR / "Scripts" / "python.exe"
-    else:
-        python_exe = _VENV_DIR / "bin" / "python"
-
-    if not python_exe.exists():
+    if not _VENV_PYTHON.exists():
         raise FileNotFoundError(
-            f"❌ Virtual environment Python not found at {python_exe}. "
+            f"❌ Virtual environment Python not found at {_VENV_PYTHON}. "
             "Did you run the check task?"
         )
-    return python_exe
+    return _VENV_PYTHON
 
 
-def _run_in_venv(c, command: str):
-    """Execute command in the activated virtual environment"""
-    if platform.system() == "Windows":
-        activate_script = _VENV_DIR / "Scripts" / "activate.bat"
-        full_cmd = f'call "{activate_script}" && {command}'
-        c.run(full_cmd)
-    else:
-        activate_script = _VENV_DIR / "bin" / "activate"
-        full_cmd = f'source "{activate_script}" && {command}'
-        c.run(full_cmd, shell="/bin/bash")
+@cache
+def _find_uv() -> str | None:
+    """Locate the uv executable on PATH once per process"""
+    return shutil.which("uv")
+
+
+def _uv() -> str:
+    """uv executable for building commands, falling back to the bare name"""
+    return _find_uv() or "uv"
+
+
+def _venv_env() -> dict[str, str]:
+    """Environment variables that activate the virtual environment"""
+    return {
+        "VIRTUAL_ENV": os.fspath(_VENV_DIR),
+        "PATH": f"{_VENV_BIN}{os.pathsep}{os.environ.get('PATH', '')}",
+    }
+
+
+@cache
+def _venv_tool(name: str) -> str | None:
+    """Absolute path of an executable in the venv scripts directory, if any"""
+    return shutil.which(name, path=os.fspath(_VENV_BIN))
+
+
+def _join_cmd(argv) -> str:
+    """Quote an argv for the shell c.run goes through (cmd.exe or /bin/sh)"""
+    argv = [str(arg) for arg in argv]
+    return subprocess.list2cmdline(argv) if _IS_WINDOWS else shlex.join(argv)
+
+
+def _run_in_venv(c, argv: list[str]):
+    """Execute a command with the virtual environment activated
+
+    Activation only exports VIRTUAL_ENV and puts the venv scripts first on
+    PATH, so set both directly instead of sourcing the activate script. A
+    leading tool that lives in the venv is called by its absolute path, and
+    every argument is quoted for the platform shell.
+    """
+    tool, *args = argv
+    c.run(_join_cmd([_venv_tool(tool) or tool, *args]), env=_venv_env())
+
+
+def _site_packages_state() -> str:
+    """mtime of the venv's site-packages, which moves when packages come or go"""
+    pattern = "Lib/site-packages" if _IS_WINDOWS else "lib/python*/site-packages"
+    for site_packages in _VENV_DIR.glob(pattern):
+        return str(site_packages.stat().st_mtime_ns)
+    return "-"
+
+
+def _install_requirements(c, *reqs: Path, cfg: dict[str, Any] | None = None):
+    """Install requirements files unless none changed since the last install
+
+    If any file is stale, all of them are resolved together in one uv call,
+    so the resolver sees every constraint. The stamps live inside .venv, so
+    recreating the environment drops them, and they also record the state
+    of site-packages, so anything else installing or removing packages there
+    (uv sync, a manual uninstall) invalidates them.
+    """
+    python_version = str(_get_config_value("python", cfg=cfg)).encode()
+    venv_state = _site_packages_state()
+    stamps: dict[Path, str] = {}
+    stale = False
+    for req in reqs:
+        hasher = hashlib.sha256(req.read_bytes())
+        hasher.update(python_version)
+        digest = hasher.hexdigest()
+        # One stamp per resolved file, so same-named files do not share it
+        path_id = hashlib.sha256(os.fsencode(req.resolve())).hexdigest()[:16]
+        stamp = _VENV_DIR / f".{req.name}.{path_id}.sha256"
+        stamps[stamp] = digest
+        try:
+            stale = stale or stamp.read_text().split() != [digest, venv_state]
+        except FileNotFoundError:
+            stale = True
+    if not stale:
+        for req in reqs:
+            logger.info("✅ %s unchanged, skipping uv pip install", req.name)
+        return
+    req_args = [arg for req in reqs for arg in ("-r", os.fspath(req))]
+    _run_in_venv(c, [_uv(), "pip", "install", *req_args])
+    venv_state = _site_packages_state()
+    for stamp, digest in stamps.items():
+        stamp.write_text(f"{digest} {venv_state}")
 
 
 @task(
@@ -101,7 +420,8 @@ def lint(c, verbose=False, path=""):
             "run",
             "--show-diff-on-failure",
             "--all-files",
-            f"{path}",
+            # An empty path would reach pre-commit as a literal '' argument
+            *([path] if path else []),
             "--color=always",
         ]
         if verbose:
@@ -113,11 +433,9 @@ def lint(c, verbose=False, path=""):
         # target_dir = _PROJECT_ROOT / path
         # logger.debug("▸ Target directory: %s", target_dir)
 
-        full_cmd = " ".join(base_cmd)
-
-        _run_in_venv(c, full_cmd)
+        _run_in_venv(c, base_cmd)
         # with c.cd(str(target_dir)):
-        #     _run_in_venv(c, full_cmd)
+        #     _run_in_venv(c, base_cmd)
 
         logger.info("✅ Linting completed successfully")
     except Exception as e:
@@ -125,19 +443,63 @@ def lint(c, verbose=False, path=""):
         raise
 
 
-@task(help={"force": "Force recreation of virtual environment"})
+_TRASH_THREADS: list[threading.Thread] = []
+
+
+def _join_trash_threads():
+    """Wait for pending virtual environment deletions before exiting"""
+    for thread in _TRASH_THREADS:
+        thread.join()
+
+
+atexit.register(_join_trash_threads)
+
+
+def _discard_venv():
+    """Move .venv aside and delete it in the background"""
+    trash = _VENV_DIR.with_name(f"{_VENV_DIR.name}.trash.{os.getpid()}")
+    os.rename(_VENV_DIR, trash)
+    thread = threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+    )
+    thread.start()
+    _TRASH_THREADS.append(thread)
+
+
+@task
+def check_uv(c):
+    """Verify uv installation and install if missing"""
+    try:
+        uv_path = _find_uv()
+        if uv_path:
+            logger.info("✅ uv already installed: %s", uv_path)
+            return
+
+        logger.info("📦 Installing uv...")
+        if _IS_WINDOWS:
+            c.run('powershell -c "irm https://astral.sh/uv/install.ps1 | iex"')
+        else:
+            c.run("curl -LsSf https://astral.sh/uv/install.sh | sh")
+        _find_uv.cache_clear()
+        logger.info("✅ uv installed successfully")
+    except Exception as e:
+        logger.error("❌ uv installation failed: %s", e)
+        raise
+
+
+@task(pre=[check_uv], help={"force": "Force recreation of virtual environment"})
 def check(c, force=False):
     """Create virtual environment if needed"""
     try:
-        python_version = _get_config_value("python")
-
         if force and _VENV_DIR.exists():
-            shutil.rmtree(_VENV_DIR)
+            _discard_venv()
             logger.info("♻️ Removing existing virtual environment")
 
         if not _VENV_DIR.exists():
+            python_version = _get_config_value("python")
             logger.info("🛠️ Creating virtual environment with Python %s", python_version)
-            c.run(f"uv venv {_VENV_DIR} --python {python_version}")
+            venv_cmd = [_uv(), "venv", os.fspath(_VENV_DIR), "--python", python_version]
+            c.run(_join_cmd(venv_cmd))
             logger.info("✅ Virtual environment created at: %s", _VENV_DIR)
         else:
             logger.info("✅ Virtual environment already exists: %s", _VENV_DIR)
@@ -146,35 +508,48 @@ def check(c, force=False):
         raise
 
 
-@task(pre=[check], help={"file": "Custom requirements file path"})
+@task(
+    pre=[check],
+    help={"file": "Custom requirements file path (comma-separated for several)"},
+)
 def deps(c, file="requirements.txt"):
     """Install additional Python dependencies"""
     try:
-        requirements = _PROJECT_ROOT / file
-        logger.info("📦 Installing dependencies from %s", requirements.name)
-        _run_in_venv(c, f"uv pip install -r {requirements}")
+        requirements = [_PROJECT_ROOT / name.strip() for name in file.split(",")]
+        logger.info(
+            "📦 Installing dependencies from %s",
+            ", ".join(req.name for req in requirements),
+        )
+        _install_requirements(c, *requirements)
         logger.info("✅ Dependencies installed successfully")
     except Exception as e:
         logger.error("❌ Dependency installation failed: %s", e)
         raise
 
 
+def _ensure_odoo_requirements(cfg: dict[str, Any] | None = None) -> Path:
+    """Download Odoo's requirements.txt from OCA/OCB when it is missing"""
+    req = _REQ_TXT
+    if not req.exists():
+        odoo_version = _get_config_path("odoo", "version", cfg=cfg)
+        logger.info(
+            f"📂 requirements.txt not found, downloading from OCA/OCB for Odoo {odoo_version}"
+        )
+        with urllib.request.urlopen(_OCB_REQS_URL, timeout=30) as response:
+            body = response.read().decode()
+        for pattern, replacement in _OCB_REQS_FIXES:
+            body = re.sub(pattern, replacement, body)
+        req.write_text(body)
+    return req
+
+
 @task(pre=[check])
 def check_odoo(c):
     """Install Odoo core dependencies"""
     try:
-        odoo_version = _get_config_path("odoo", "version")
-        # requirements = odoo_path / "requirements.txt"
-        req = _PROJECT_ROOT / "requirements.txt"
-        if not req.exists():
-            logger.info(
-                f"📂 requirements.txt not found, downloading from OCA/OCB for Odoo {odoo_version}"
-            )
-            c.run(
-                "curl -o requirements.txt https://raw.githubusercontent.com/OCA/OCB/17.0/requirements.txt && sed -i -E \"s/(gevent==)21\.8\.0( ; sys_platform != 'win32' and python_version == '3.10')/\\122.10.2\\2/;s/(greenlet==)1.1.2( ; sys_platform != 'win32' and python_version == '3.10')/\\12.0.2\\2/\" requirements.txt"
-            )
+        req = _ensure_odoo_requirements()
         logger.info("📦 Installing Odoo dependencies...")
-        _run_in_venv(c, "uv pip install -r requirements.txt")
+        _install_requirements(c, req)
         logger.info("✅ Odoo dependencies installed successfully")
     except Exception as e:
         logger.error("❌ Odoo dependency installation failed: %s", e)
@@ -187,233 +562,221 @@ def aggregate(c, config="repos.yaml"):
     try:
         repos_file = _PROJECT_ROOT / config
         logger.info("🔄 Synchronizing repositories with %s", repos_file.name)
-        _run_in_venv(c, f"gitaggregate -c {repos_file}")
+        _run_in_venv(c, ["gitaggregate", "-c", os.fspath(repos_file)])
         logger.info("✅ Repository synchronization completed")
     except Exception as e:
         logger.error("❌ Repository synchronization failed: %s", e)
         raise
 
 
+def _strict_realpath(path: Path) -> str | None:
+    """Resolved path, or None when it (or a symlink target) is missing"""
+    try:
+        return os.path.realpath(path, strict=True)
+    except OSError:
+        return None
+
+
+def _valid_repos(repos_config: list[str], odoo_path: Path) -> list[str]:
+    """Resolve configured repositories, dropping missing, server and duplicate paths
+
+    Paths are returned as strings, which is all the generated files need.
+    """
+    candidates = [
+        repo_path if repo_path.is_absolute() else _PROJECT_ROOT / repo_path
+        for repo_path in map(Path, repos_config)
+    ]
+    # One scandir per parent directory instead of one stat per repository
+    dir_entries = _scan_dirs({repo_path.parent for repo_path in candidates})
+    odoo_key = os.fspath(odoo_path)
+    pending: list[Path] = []
+    seen_paths: set[str] = set()
+
+    for repo_path in candidates:
+        # Plain string checks catch the common repeats before any syscall
+        repo_str = os.fspath(repo_path)
+        if repo_str == odoo_key:
+            logger.info("⏩ Skipping server path in repos: %s", repo_str)
+            continue
+        if repo_str in seen_paths:
+            logger.info("⏩ Skipping duplicate path: %s", repo_str)
+            continue
+        seen_paths.add(repo_str)
+
+        # scandir names are compared exactly; a miss still gets a real stat so
+        # case-insensitive filesystems (macOS, Windows) match as before
+        repo_exists = (
+            repo_path.name in dir_entries[repo_path.parent] or repo_path.exists()
+        )
+        if not repo_exists:
+            logger.warning("⚠️ Repository path does not exist: %s", repo_path)
+            continue
+        pending.append(repo_path)
+
+    # realpath walks every component; resolve independent repos concurrently
+    if len(pending) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as pool:
+            resolved = list(pool.map(_strict_realpath, pending))
+    else:
+        resolved = [_strict_realpath(repo_path) for repo_path in pending]
+
+    debug = logger.isEnabledFor(logging.DEBUG)
+    valid_repos: list[str] = []
+    seen_resolved: set[str] = set()
+    for repo_path, repo_resolved in zip(pending, resolved, strict=True):
+        # strict resolution also rejects entries that are dangling symlinks
+        if repo_resolved is None:
+            logger.warning("⚠️ Repository path does not exist: %s", repo_path)
+            continue
+        if repo_resolved == odoo_key:
+            logger.info("⏩ Skipping server path in repos: %s", repo_resolved)
+            continue
+        if repo_resolved in seen_resolved:
+            logger.info("⏩ Skipping duplicate path: %s", repo_resolved)
+            continue
+
+        seen_resolved.add(repo_resolved)
+        valid_repos.append(repo_resolved)
+        if debug:
+            logger.debug("▸ Valid repository: %s", repo_resolved)
+    return valid_repos
+
+
+def _write_pyright_config(analysis_paths: list[str]):
+    """Write pyrightconfig.json with the given analysis paths"""
+    logger.info("🛠️ Generating %s", _PYRIGHT_CONF.name)
+    if _dump_json({"extraPaths": analysis_paths}, _PYRIGHT_CONF):
+        logger.info(
+            "✅ %s created with %d paths", _PYRIGHT_CONF.name, len(analysis_paths)
+        )
+    else:
+        logger.info("⏩ %s already up to date", _PYRIGHT_CONF.name)
+
+
+def _write_vscode_settings(settings: dict[str, Any]):
+    """Write .vscode/settings.json"""
+    logger.info("🛠️ Generating %s", _VSCODE_SETTINGS.name)
+    _VSCODE_DIR.mkdir(exist_ok=True)
+    if _dump_json(settings, _VSCODE_SETTINGS):
+        logger.info("✅ %s created", _VSCODE_SETTINGS.name)
+    else:
+        logger.info("⏩ %s already up to date", _VSCODE_SETTINGS.name)
+
+
+def _write_odoo_conf(addons_paths: list[str]):
+    """Set addons_path in the [options] section of odoo.conf"""
+    logger.info("🛠️ Updating %s", _ODOO_CONF.name)
+    new_addons_line = f"addons_path = {','.join(addons_paths)}\n"
+
+    try:
+        conf_text = _ODOO_CONF.read_bytes().decode()
+    except FileNotFoundError:
+        conf_text = ""
+    # Edit with bare \n, then write back using the file's own line endings
+    newline = "\r\n" if "\r\n" in conf_text else "\n"
+    conf_text = conf_text.replace("\r\n", "\n")
+    if conf_text and not conf_text.endswith("\n"):
+        conf_text += "\n"
+
+    # Replace addons_path inside [options], or add it right after the header
+    options = _CONF_OPTIONS_RE.search(conf_text)
+    if options is None:
+        conf_text += "\n[options]\n" + new_addons_line
+    else:
+        body, replaced = _CONF_ADDONS_RE.subn(
+            new_addons_line, options.group(1), count=1
+        )
+        if not replaced:
+            body = new_addons_line + body
+        conf_text = conf_text[: options.start(1)] + body + conf_text[options.end(1) :]
+
+    if newline != "\n":
+        conf_text = conf_text.replace("\n", newline)
+    if _write_if_changed(_ODOO_CONF, conf_text.encode()):
+        logger.info("✅ %s updated successfully", _ODOO_CONF.name)
+    else:
+        logger.info("⏩ %s already up to date", _ODOO_CONF.name)
+    logger.debug("▸ New addons_path line: %s", new_addons_line.strip())
+
+
 @task(help={"ide": "Generate configuration for specific IDE (vscode)"})
 def config(c, ide="vscode"):
     """Generate development environment configuration files"""
     try:
-        config = _load_config()
-        odoo_config = config.get("odoo", {})
-        repos_config = config.get("repos", [])
-
-        odoo_path = Path(odoo_config.get("server", "")).resolve()
-        enterprise_path = (
-            Path(odoo_config.get("enterprise", "")).resolve()
-            if odoo_config.get("enterprise")
-            else None
-        )
+        paths = _paths()
+        repos_config = _load_config().get("repos", [])
+
+        odoo_path = paths.server
+        enterprise_path = paths.enterprise
 
         logger.info("🔍 Validating core paths...")
-        if not odoo_path.exists():
+        # odoo_path and enterprise_path come resolved from _paths(), so lstat
+        # matches stat for them
+        if not os.path.lexists(odoo_path):
             raise FileNotFoundError(f"❌ Odoo path not found: {odoo_path}")
+        enterprise_exists = enterprise_path is not None and os.path.lexists(
+            enterprise_path
+        )
 
+        # addons itself may be a symlink, so follow it
         server_addons_path = odoo_path / "addons"
-        if not server_addons_path.exists():
+        if not os.path.exists(server_addons_path):
             logger.warning("⚠️ Odoo addons directory missing: %s", server_addons_path)
 
         logger.info("📦 Processing repositories...")
-        valid_repos = []
-        seen_paths = set()
-
-        for repo in repos_config:
-            repo_path = Path(repo)
-            if not repo_path.is_absolute():
-                repo_path = _PROJECT_ROOT / repo_path
-            repo_resolved = repo_path.resolve()
+        valid_repos = _valid_repos(repos_config, odoo_path)
 
-            if not repo_resolved.exists():
-                logger.warning("⚠️ Repository path does not exist: %s", repo_resolved)
-                continue
+        addons_paths = [os.fspath(server_addons_path)]
+        if enterprise_exists:
+            addons_paths.append(os.fspath(enterprise_path))
+        addons_paths.extend(valid_repos)
 
-            if repo_resolved == odoo_path:
-                logger.info("⏩ Skipping server path in repos: %s", repo_resolved)
-                continue
-
-            if repo_resolved in seen_paths:
-                logger.info("⏩ Skipping duplicate path: %s", repo_resolved)
-                continue
-
-            seen_paths.add(repo_resolved)
-            valid_repos.append(repo_resolved)
-            logger.debug("▸ Valid repository: %s", repo_resolved)
-
-        # Generate pyrightconfig.json
-        pyright_config = _PROJECT_ROOT / "pyrightconfig.json"
-        logger.info("🛠️ Generating %s", pyright_config.name)
-
-        analysis_paths = [str(server_addons_path)]
-        if (
-            enterprise_path
-            and enterprise_path.exists()
-            and enterprise_path != odoo_path
-        ):
-            analysis_paths.append(str(enterprise_path))
-        analysis_paths.extend(str(repo) for repo in valid_repos)
-
-        with open(pyright_config, "w") as f:
-            analysis_paths.append(str(odoo_path))
-            json.dump({"extraPaths": analysis_paths}, f, indent=4)
-        logger.info(
-            "✅ %s created with %d paths", pyright_config.name, len(analysis_paths)
+        # pyright and VSCode see the addons plus the server itself, last and once
+        odoo_key = os.fspath(odoo_path)
+        analysis_paths = list(
+            dict.fromkeys([*(p for p in addons_paths if p != odoo_key), odoo_key])
         )
 
         # Generate VSCode configuration
+        settings = None
         if ide.lower() == "vscode":
-            vscode_dir = _PROJECT_ROOT / ".vscode"
-            vscode_dir.mkdir(exist_ok=True)
-            vscode_settings = vscode_dir / "settings.json"
-
-            logger.info("🛠️ Generating %s", vscode_settings.name)
             settings = {
                 "settings": {
                     "python.autoComplete.extraPaths": analysis_paths,
                     "python.analysis.extraPaths": analysis_paths,
-                    "python.languageServer": "None",
-                    "[python]": {
-                        "editor.formatOnSave": True,
-                        "editor.codeActionsOnSave": {
-                            "source.fixAll": "explicit",
-                            "source.organizeImports": "explicit",
-                        },
-                        "editor.defaultFormatter": "charliermarsh.ruff",
-                    },
                     "python.linting.ignorePatterns": [f"{odoo_path}/**/*.py"],
                     "python.linting.pylintArgs": [
                         f"--init-hook=\"import sys;sys.path.append('{odoo_path}')\"",
                         "--load-plugins=pylint_odoo",
                     ],
-                    "python.linting.pylintEnabled": True,
-                    "python.defaultInterpreterPath": str(_get_venv_python()),
-                    "restructuredtext.confPath": "",
-                    "search.followSymlinks": False,
-                    "search.useIgnoreFiles": False,
-                    "[json]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
-                    "[jsonc]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
-                    "[markdown]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
-                    "[yaml]": {"editor.defaultFormatter": "esbenp.prettier-vscode"},
-                    "[xml]": {"editor.formatOnSave": False},
-                    "workbench.editor.customLabels.patterns": {
-                        "**/security/**": "${filename} - Security",
-                        "**/security/*.csv": "${filename}.${extname} - Security",
-                        "**/models/**": "${filename} - Model",
-                        "**/data/*.csv": "${filename}.${extname} - Data",
-                        "**/data/**": "${filename} - Data",
-                        "**/demo/**": "${filename} - Demo",
-                        "**/controllers/**": "${filename} - Controller",
-                        "**/wizard/**": "${filename} - Wizard",
-                        "**/wizards/**": "${filename} - Wizard",
-                        "**/reports/**": "${filename} - Report",
-                        "**/report/**": "${filename} - Report",
-                        "**/tests/**": "${filename} - Test",
-                        "**/views/**": "${filename} - View",
-                        "**/static/src/**/*.js": "${filename} - Component ",
-                        "**/static/src/**/*.xml": "${filename} - Template",
-                        "**/static/src/**/*.scss": "${filename} - Style",
-                        "**/__manifest__.py": "${dirname} - Odoo Manifest",
-                        "**/__init__.py": "${dirname} - Module",
-                        "**/docs/**": "${dirname} - Docs",
-                        "**/doc/**": "${dirname} - Docs",
-                    },
+                    "python.defaultInterpreterPath": os.fspath(_get_venv_python()),
+                    **_VSCODE_SETTINGS_STATIC,
                 }
             }
 
-            with open(vscode_settings, "w") as f:
-                json.dump(settings, f, indent=4)
-            logger.info("✅ %s created", vscode_settings.name)
-
-        # Update odoo.conf
-        odoo_conf_path = _PROJECT_ROOT / "odoo.conf"
-        logger.info("🛠️ Updating %s", odoo_conf_path.name)
-
-        addons_paths = [str(server_addons_path)]
-        if enterprise_path and enterprise_path.exists():
-            addons_paths.append(str(enterprise_path))
-        addons_paths.extend(str(repo) for repo in valid_repos)
-
-        new_addons_line = f"addons_path = {','.join(addons_paths)}\n"
-
-        # Original update logic
-        conf_lines = []
-        if odoo_conf_path.exists():
-            with open(odoo_conf_path) as f:
-                conf_lines = f.readlines()
-
-        in_options = False
-        updated = False
-        new_conf = []
-
-        for line in conf_lines:
-            stripped = line.strip()
-
-            if stripped.startswith("[options]"):
-                in_options = True
-                new_conf.append(line)
-                continue
-
-            if in_options:
-                if stripped.startswith("addons_path"):
-                    new_conf.append(new_addons_line)
-                    updated = True
-                    continue
-                elif stripped.startswith("[") and stripped.endswith("]"):
-                    in_options = False
-
-            new_conf.append(line)
-
-        if not updated:
-            options_found = False
-            for i, line in enumerate(new_conf):
-                if line.strip().startswith("[options]"):
-                    new_conf.insert(i + 1, new_addons_line)
-                    options_found = True
-                    break
-
-            if not options_found:
-                new_conf.append("\n[options]\n")
-                new_conf.append(new_addons_line)
-
-        with open(odoo_conf_path, "w") as f:
-            f.writelines(new_conf)
-
-        logger.info("✅ %s updated successfully", odoo_conf_path.name)
-        logger.debug("▸ New addons_path line: %s", new_addons_line.strip())
+        # The three files are independent, so write them concurrently
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(_write_pyright_config, analysis_paths),
+                pool.submit(_write_odoo_conf, addons_paths),
+            ]
+            if settings is not None:
+                futures.append(pool.submit(_write_vscode_settings, settings))
+            for future in futures:
+                future.result()
+
         logger.info("🎉 Configuration completed!")
         logger.debug("▸ Total repositories: %d", len(valid_repos))
-        logger.debug(
-            "▸ Addons paths:\n%s", "\n".join(f"• {path}" for path in addons_paths)
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "▸ Addons paths:\n%s", "\n".join(f"• {path}" for path in addons_paths)
+            )
 
     except Exception as e:
         logger.error("❌ Configuration failed: %s", e)
         raise
 
 
-@task(pre=[check])
-def check_uv(c):
-    """Verify uv installation and install if missing"""
-    try:
-        uv_path = shutil.which("uv")
-        if uv_path:
-            logger.info("✅ uv already installed: %s", uv_path)
-            return
-
-        logger.info("📦 Installing uv...")
-        if platform.system() == "Windows":
-            c.run('powershell -c "irm https://astral.sh/uv/install.ps1 | iex"')
-        else:
-            c.run("curl -LsSf https://astral.sh/uv/install.sh | sh")
-        logger.info("✅ uv installed successfully")
-    except Exception as e:
-        logger.error("❌ uv installation failed: %s", e)
-        raise
-
-
 @task(
     help={
         "skip_deps": "Skip dependency installation (default: False)",
@@ -434,13 +797,23 @@ def install(
     try:
         # Validación inicial
         logger.info("🚀 Starting environment setup...")
-        check(c)  # Siempre verificar el entorno
-
-        # Diagrama de ejecución
+        cfg = _load_config()  # Una sola lectura de config.yaml para todos los pasos
+        # Siempre verificar uv y el entorno (install no tiene pre=[check])
+        check_uv(c)
+        check(c)
+
+        # Diagrama de ejecución: gitaggregate importa requests del mismo .venv
+        # que uv está actualizando, y la configuración valida rutas que
+        # gitaggregate puede haber creado
         steps = {
-            "Dependencies": (not skip_deps, lambda: (check_odoo(c))),
-            "Configuration": (not skip_config, lambda: config(c)),
+            "Dependencies": (
+                not skip_deps,
+                lambda: _install_requirements(
+                    c, _ensure_odoo_requirements(cfg), cfg=cfg
+                ),
+            ),
             "Repositories": (not skip_aggregate, lambda: aggregate(c)),
+            "Configuration": (not skip_config, lambda: config(c)),
         }
 
         # Ejecutar pasos condicionalmente
@@ -472,11 +845,12 @@ def install(
 def update(c, update_deps=False):
     """Update development environment components"""
     try:
+        # deps, aggregate and config already ran as pre-tasks
         if update_deps:
             logger.info("🔄 Updating dependencies...")
-            _run_in_venv(c, "uv pip install --upgrade -r requirements.txt")
-        aggregate(c)
-        config(c)
+            _run_in_venv(
+                c, [_uv(), "pip", "install", "--upgrade", "-r", os.fspath(_REQ_TXT)]
+            )
         logger.info("✅ Environment update completed")
     except Exception as e:
         logger.error("❌ Update failed: %s", e)
@@ -500,17 +874,12 @@ def start(c, options: str = "", config_file: str = "odoo.conf"):
     try:
         logger.info("🚀 Initializing Odoo server...")
 
-        # 1. Load configuration
-        config = _load_config()
-        odoo_config = config.get("odoo", {})
-
-        # 2. Validate Odoo installation
-        odoo_path = Path(odoo_config.get("server", "")).resolve()
-        odoo_bin = odoo_path / "odoo-bin"
+        # 1. Validate Odoo installation
+        odoo_bin = _paths().server / "odoo-bin"
         if not odoo_bin.exists():
             raise FileNotFoundError(f"❌ Odoo executable not found at {odoo_bin}")
 
-        # 3. Validate config file
+        # 2. Validate config file
         config_path = _PROJECT_ROOT / config_file
         if not config_path.exists():
             logger.warning("⚠️ Configuration file not found: %s", config_path)
@@ -518,15 +887,18 @@ def start(c, options: str = "", config_file: str = "odoo.conf"):
                 "Run 'invoke config' first to generate configuration"
             )
 
-        # 4. Build command components
+        # 3. Build command components
         venv_python = _get_venv_python()
+        argv = [
+            os.fspath(venv_python),
+            os.fspath(odoo_bin),
+            "-c",
+            os.fspath(config_path),
+            *shlex.split(options, posix=not _IS_WINDOWS),
+        ]
+        full_cmd = _join_cmd(argv)
 
-        base_cmd = [f'"{venv_python}"', f"{odoo_bin}", "-c", f'"{config_path}"']
-
-        base_cmd.append(options.strip())
-        full_cmd = " ".join(base_cmd)
-
-        # 5. Logging and execution
+        # 4. Logging and execution
         logger.info("⚙️ Server configuration:")
         logger.debug("▸ Python: %s", venv_python)
         logger.debug("▸ Odoo bin: %s", odoo_bin)
@@ -534,7 +906,7 @@ def start(c, options: str = "", config_file: str = "odoo.conf"):
         logger.info("▸ Command: %s", full_cmd)
 
         logger.info("🔄 Starting Odoo server...")
-        with c.cd(str(_PROJECT_ROOT)):
+        with c.cd(os.fspath(_PROJECT_ROOT)):
             c.run(full_cmd, pty=True, echo=True)
 
     except Exception as e:
@@ -552,24 +924,22 @@ def _get_backup_config():
     Returns:
         tuple: (config_path, dest_dir, backup_format, odoo_server_path, target_dir)
     """
-    config = _load_config()
-    database_config = config.get("database", {})
-    odoo_config = config.get("odoo", {})
     target_dir = None  # Inicializar para manejo de errores
 
-    config_path = Path(database_config["odoo_conf"]).resolve()
-    dest_dir = Path(database_config["dest_dir"])
-    odoo_server_path = Path(odoo_config.get("server", "")).resolve()
+    paths = _paths()
+    if paths.db_conf is None or paths.dest_dir is None:
+        logger.error("❌ Missing configuration key: database.odoo_conf/dest_dir")
+        raise ValueError("Missing configuration key: database.odoo_conf/dest_dir")
 
     return {
-        "config_path": config_path,
-        "dest_dir": dest_dir,
-        "odoo_server_path": odoo_server_path,
+        "config_path": paths.db_conf,
+        "dest_dir": paths.dest_dir,
+        "odoo_server_path": paths.server,
         "target_dir": target_dir,
     }
 
 
-def _make_cmd(cmd: str, config_path: Path, odoo_server_path: Path) -> list:
+def _make_cmd(cmd: str, config_path: Path, odoo_server_path: Path) -> list[str]:
     if not odoo_server_path.exists():
         raise FileNotFoundError(f"❌ Ruta de Odoo no encontrada: {odoo_server_path}")
     if not config_path.exists():
@@ -580,13 +950,95 @@ def _make_cmd(cmd: str, config_path: Path, odoo_server_path: Path) -> list:
 
     # 3. Construir comando con parámetros de config.yaml
     base_cmd = [
-        f'"{venv_python}"',
+        os.fspath(venv_python),
         "-m",
         f"click_odoo_contrib.{cmd}",
         "-c",
-        f'"{config_path}"',
+        os.fspath(config_path),
     ]
-    return base_cmd or []
+    return base_cmd
+
+
+_WORKER: subprocess.Popen | None = None
+_WORKER_REPLIES = None
+
+
+def _stop_worker():
+    """Close the click-odoo-contrib worker at interpreter exit"""
+    if _WORKER is None or _WORKER.poll() is not None:
+        return
+    _WORKER.stdin.close()
+    try:
+        _WORKER.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        _WORKER.kill()
+
+
+def _get_worker(cwd: Path) -> subprocess.Popen:
+    """Get the worker process, starting it on first use
+
+    Replies come back on a pipe of their own, so the worker and the
+    pg_dump/psql processes it spawns keep the terminal's stdout and stderr.
+    """
+    global _WORKER, _WORKER_REPLIES
+    if _WORKER is None or _WORKER.poll() is not None:
+        if _WORKER_REPLIES is not None:
+            _WORKER_REPLIES.close()
+        read_fd, write_fd = os.pipe()
+        if _IS_WINDOWS:
+            import msvcrt
+
+            handle = msvcrt.get_osfhandle(write_fd)
+            os.set_handle_inheritable(handle, True)
+            channel = str(handle)
+            startupinfo = subprocess.STARTUPINFO(
+                lpAttributeList={"handle_list": [handle]}
+            )
+            inherit = {"startupinfo": startupinfo}
+        else:
+            channel = str(write_fd)
+            inherit = {"pass_fds": (write_fd,)}
+        try:
+            _WORKER = subprocess.Popen(
+                [os.fspath(_get_venv_python()), "-u", os.fspath(_ODOO_WORKER), channel],
+                stdin=subprocess.PIPE,
+                text=True,
+                cwd=cwd,
+                env={**os.environ, **_venv_env()},
+                **inherit,
+            )
+        except OSError:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        _WORKER_REPLIES = os.fdopen(read_fd, encoding="utf-8")
+    return _WORKER
+
+
+atexit.register(_stop_worker)
+
+
+def _run_click_odoo(c, base_cmd: list[str], cwd: Path):
+    """Run a _make_cmd command in the long-running click-odoo-contrib worker
+
+    Odoo is imported once by the worker instead of once per command. The
+    command is echoed like c.run(echo=True) would, --dry skips it, and a
+    failure raises UnexpectedExit just as c.run does.
+    """
+    _python, _, module, *args = base_cmd
+    command = _join_cmd(base_cmd)
+    print(c.config.run.echo_format.format(command=command), flush=True)
+    if c.config.run.dry:
+        return
+    worker = _get_worker(cwd)
+    worker.stdin.write(json.dumps({"module": module, "args": args}) + "\n")
+    worker.stdin.flush()
+    reply = _WORKER_REPLIES.readline()
+    # An empty reply means the worker died; report its own exit code
+    code = json.loads(reply)["code"] if reply else worker.wait() or 1
+    if code:
+        raise UnexpectedExit(Result(command=command, exited=code, hide=()))
 
 
 @task
@@ -619,8 +1071,7 @@ def backupdb(c, dbname, format="zip"):
         base_cmd = _make_cmd(
             "backupdb", config["config_path"], config["odoo_server_path"]
         )
-        base_cmd.extend([dbname, str(target_dir), "--format", str(format)])
-        full_cmd = " ".join(base_cmd)
+        base_cmd.extend([dbname, os.fspath(target_dir), "--format", str(format)])
 
         # 5. Ejecutar backup desde directorio de Odoo
         logger.info("⚙️ Ejecutando backup de base de datos...")
@@ -628,8 +1079,7 @@ def backupdb(c, dbname, format="zip"):
         logger.debug("▸ Destino: %s", target_dir)
         logger.debug("▸ Formato: %s", format)
 
-        with c.cd(str(config["odoo_server_path"])):
-            c.run(full_cmd, pty=True, echo=True)
+        _run_click_odoo(c, base_cmd, config["odoo_server_path"])
 
     except Exception as e:
         logger.error("❌ Error al salvar la base de datos: %s", e)
@@ -667,15 +1117,12 @@ def dropdb(c, dbname, exists: bool = False):
 
         base_cmd.append(dbname)
 
-        full_cmd = " ".join(base_cmd)
-
         # 5. Ejecutar backup desde directorio de Odoo
         logger.info("🗑️ Eliminando la base de datos...")
         logger.debug("▸ Configuración: %s", config["config_path"])
 
-        with c.cd(str(config["odoo_server_path"])):
-            c.run(full_cmd, pty=True, echo=True)
-            logger.info("✅ Base de datos %s eliminada correctamente", dbname)
+        _run_click_odoo(c, base_cmd, config["odoo_server_path"])
+        logger.info("✅ Base de datos %s eliminada correctamente", dbname)
 
     except Exception as e:
         logger.error("❌ Error al eliminar la base de datos: %s", e)
@@ -700,14 +1147,11 @@ def listdb(c):
             "listdb", config["config_path"], config["odoo_server_path"]
         )
 
-        full_cmd = " ".join(base_cmd)
-
         # 5. Ejecutar backup desde directorio de Odoo
         logger.info("📋 Listando todas las bases de datos...")
         logger.debug("▸ Configuración: %s", config["config_path"])
 
-        with c.cd(str(config["odoo_server_path"])):
-            c.run(full_cmd, pty=True, echo=True)
+        _run_click_odoo(c, base_cmd, config["odoo_server_path"])
 
     except Exception as e:
         logger.error("❌ Error al eliminar la base de datos: %s", e)
@@ -751,14 +1195,11 @@ def initdb(c, dbname, modules=None, demo=True, cache=False):
 
         base_cmd.extend(["-n", dbname])
 
-        full_cmd = " ".join(base_cmd)
-
         # 5. Ejecutar backup desde directorio de Odoo
         logger.info("📋 Inicializando la base de datos %s", dbname)
         logger.debug("▸ Configuración: %s", config["config_path"])
 
-        with c.cd(str(config["odoo_server_path"])):
-            c.run(full_cmd, pty=True, echo=True)
+        _run_click_odoo(c, base_cmd, config["odoo_server_path"])
 
     except Exception as e:
         logger.error("❌ Error al Inicializar la base de datos: %s", e)
@@ -792,14 +1233,11 @@ def uninstall(c, dbname, modules=None):
 
         base_cmd.extend(["-d", dbname])
 
-        full_cmd = " ".join(base_cmd)
-
         # 5. Ejecutar backup desde directorio de Odoo
         logger.info("📋 Desinstalando modulos la base de datos %s", dbname)
         logger.debug("▸ Configuración: %s", config["config_path"])
 
-        with c.cd(str(config["odoo_server_path"])):
-            c.run(full_cmd, pty=True, echo=True)
+        _run_click_odoo(c, base_cmd, config["odoo_server_path"])
 
     except Exception as e:
         logger.error("❌ Error al desinstalar modulos de la base de datos: %s", e)